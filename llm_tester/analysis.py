@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Iterable, List, Sequence
 
 from llm_tester.rules import Rule, evaluate_with_default_rules
@@ -15,10 +16,33 @@ class ResponseAnalysis:
     triggered_rules: List[str]
 
 
-def _evaluate_rules(text: str, rules: Sequence[Rule] | None) -> List[Rule]:
+@lru_cache(maxsize=1024)
+def _default_rule_names(text: str, max_hits: int | None) -> tuple[str, ...]:
+    """Memoized default-rule evaluation keyed on the text itself.
+
+    Identical responses are common in demo mode and with deterministic
+    system prompts; repeats then cost a dict lookup instead of a full rule
+    sweep. Only the default path is cached - caller-supplied rule lists may
+    be mutable and are evaluated directly.
+    """
+
+    return tuple(
+        rule.name for rule in evaluate_with_default_rules(text, max_hits=max_hits)
+    )
+
+
+def _evaluate_rule_names(
+    text: str, rules: Sequence[Rule] | None, max_hits: int | None = None
+) -> Iterable[str]:
     if rules is None:
-        return evaluate_with_default_rules(text)
-    return [rule for rule in rules if rule.check(text)]
+        return _default_rule_names(text, max_hits)
+    triggered: List[str] = []
+    for rule in rules:
+        if rule.check(text):
+            triggered.append(rule.name)
+            if max_hits is not None and len(triggered) >= max_hits:
+                break
+    return triggered
 
 
 def analyze_response(
@@ -28,28 +52,30 @@ def analyze_response(
     include_prompt_analysis: bool = False,
     prompt: str | None = None,
     prompt_rules: Sequence[Rule] | None = None,
+    max_hits: int | None = None,
 ) -> ResponseAnalysis:
     """Analyze a response and return triggered rule names and metadata.
 
     ``include_prompt_analysis`` keeps backward compatibility by defaulting to
     ``False``. When set to ``True`` and a ``prompt`` is provided, the prompt text
     is evaluated with either ``prompt_rules`` (if provided) or the main
-    ``rules``.
+    ``rules``. ``max_hits`` limits how many rules are collected per evaluated
+    text; callers that only need a flagged/not-flagged signal can pass ``1``.
     """
 
     triggered_rule_names: List[str] = []
     seen_names = set()
 
-    for rule in _evaluate_rules(response, rules):
-        triggered_rule_names.append(rule.name)
-        seen_names.add(rule.name)
+    for name in _evaluate_rule_names(response, rules, max_hits):
+        triggered_rule_names.append(name)
+        seen_names.add(name)
 
     if include_prompt_analysis and prompt is not None:
-        for rule in _evaluate_rules(prompt, prompt_rules or rules):
-            if rule.name in seen_names:
+        for name in _evaluate_rule_names(prompt, prompt_rules or rules, max_hits):
+            if name in seen_names:
                 continue
-            triggered_rule_names.append(rule.name)
-            seen_names.add(rule.name)
+            triggered_rule_names.append(name)
+            seen_names.add(name)
 
     return ResponseAnalysis(
         response_length=len(response),
@@ -4,14 +4,14 @@ from __future__ import annotations
 import asyncio
 import os
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from functools import partial
 from typing import List, Sequence
 
 from llm_tester.analysis import analyze_response
 from llm_tester.prompts import Prompt
 from llm_tester.providers import LLMProvider, ProviderError
 from llm_tester.rules import Rule
-from llm_tester.runner import DEMO_ENV, ResultRecord
+from llm_tester.runner import DEMO_ENV, ResultRecord, _utc_now_iso
 
 
 @dataclass
@@ -122,32 +122,45 @@ async def _run_single_prompt(
         if provider is None:
             raise ProviderError("LLM provider is not configured")
 
-        # Run synchronous provider call in executor to avoid blocking
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None, provider.generate, prompt.text, model, system_prompt
-        )
+        # Prefer a native async generate (e.g. an aiohttp-backed client) so
+        # N prompts overlap on one thread; otherwise fall back to running
+        # the blocking call in the default executor.
+        agenerate = getattr(provider, "agenerate", None)
+        if agenerate is not None:
+            response = await agenerate(prompt.text, model, system_prompt)
+        else:
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(
+                None, provider.generate, prompt.text, model, system_prompt
+            )
 
         provider_name = provider.get_provider_name()
         cost = provider.estimate_cost(prompt.text, response, model)
 
-    # Run analysis (also in executor if needed)
-    analysis = analyze_response(
-        response,
-        rules=rules,
-        include_prompt_analysis=analyze_prompt,
-        prompt=prompt.text,
-        prompt_rules=prompt_rules,
+    # Rule evaluation is CPU-bound; run it in the default executor so the
+    # event loop can dispatch the next HTTP request while this response is
+    # being scanned.
+    loop = asyncio.get_running_loop()
+    analysis = await loop.run_in_executor(
+        None,
+        partial(
+            analyze_response,
+            response,
+            rules=rules,
+            include_prompt_analysis=analyze_prompt,
+            prompt=prompt.text,
+            prompt_rules=prompt_rules,
+        ),
     )
 
     return ResultRecord(
-        timestamp=datetime.now(timezone.utc).isoformat(),
+        timestamp=_utc_now_iso(),
         prompt=prompt.text,
         prompt_category=prompt.category,
         response=response,
         model=model,
         response_length=analysis.response_length,
-        triggered_rules=analysis.triggered_rules,
+        triggered_rules=tuple(analysis.triggered_rules),
         cost_usd=cost,
         provider=provider_name,
     )
@@ -210,7 +223,14 @@ async def run_assessment_async(
     ]
 
     # Execute all tasks concurrently and gather results
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    try:
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        # Providers holding loop-bound resources (e.g. an aiohttp session)
+        # must release them before this loop goes away.
+        aclose = getattr(provider, "aclose", None)
+        if aclose is not None:
+            await aclose()
 
     # Filter out exceptions and collect successful results
     successful_results = []
@@ -1,31 +1,95 @@
 """Ollama client abstraction."""
 from __future__ import annotations
 
+import asyncio
+import http.client
 import json
 import os
 import socket
 import sys
+import threading
 import time
 import urllib.error
 import urllib.request
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from typing import List, Sequence
+from urllib.parse import urlsplit
+
+try:
+    import aiohttp  # type: ignore
+
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import msgspec  # type: ignore
+
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
 
 DEFAULT_BASE_URL = "http://localhost:11434"
 BASE_URL_ENV = "OLLAMA_URL"
 
+# One reusable C decoder beats per-call json.loads on allocation pressure;
+# it still produces a plain dict, so extract_message is unaffected.
+_MSGSPEC_DECODER = msgspec.json.Decoder() if MSGSPEC_AVAILABLE else None
+
+
+_REQUEST_HEADERS = {
+    "Content-Type": "application/json",
+    "Connection": "keep-alive",
+}
+
+
+@lru_cache(maxsize=8)
+def _payload_prefix(model: str) -> bytes:
+    """Constant generate-payload bytes for a model, serialized once.
+
+    A sweep sends thousands of requests that differ only in the prompt, so
+    the model/stream fields are encoded per model rather than per call.
+    """
+
+    return b'{"model":' + json.dumps(model).encode("utf-8") + b',"stream":false,"prompt":'
+
 
 class OllamaError(RuntimeError):
     """Raised when Ollama returns an error or unexpected payload."""
 
 
+def _parse_payload(content: str) -> dict:
+    """Decode a generate-endpoint body, mapping parse errors to OllamaError."""
+
+    if _MSGSPEC_DECODER is not None:
+        try:
+            return _MSGSPEC_DECODER.decode(content)
+        except msgspec.DecodeError as exc:
+            raise OllamaError("Invalid JSON response from Ollama") from exc
+    try:
+        return json.loads(content)
+    except json.JSONDecodeError as exc:
+        raise OllamaError("Invalid JSON response from Ollama") from exc
+
+
 @dataclass
 class OllamaClient:
-    """Minimal HTTP client for the Ollama generate endpoint."""
+    """Minimal HTTP client for the Ollama generate endpoint.
+
+    Requests reuse one keep-alive connection per thread, so a prompt sweep
+    pays the TCP handshake once per worker instead of once per prompt.
+    """
 
     base_url: str
     timeout: int = 30
     debug: bool = False
     retries: int = 0
+    _local: threading.local = field(
+        default_factory=threading.local, init=False, repr=False, compare=False
+    )
+    _aiohttp_session: object = field(default=None, init=False, repr=False, compare=False)
+    _aiohttp_loop: object = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def from_env(
@@ -37,38 +101,74 @@ class OllamaClient:
     def _build_url(self) -> str:
         return f"{self.base_url.rstrip('/')}/api/generate"
 
+    def _request_path(self) -> str:
+        path = urlsplit(self.base_url).path.rstrip("/")
+        return f"{path}/api/generate"
+
+    def _get_connection(self) -> http.client.HTTPConnection:
+        """Return this thread's persistent connection, creating it lazily."""
+
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            parts = urlsplit(self.base_url)
+            connection_cls = (
+                http.client.HTTPSConnection
+                if parts.scheme == "https"
+                else http.client.HTTPConnection
+            )
+            connection = connection_cls(parts.hostname, parts.port, timeout=self.timeout)
+            self._local.connection = connection
+        return connection
+
+    def _close_connection(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def _do_request(self, body: bytes) -> tuple[int, str]:
+        """POST to the generate endpoint over the persistent connection.
+
+        Returns ``(status, decoded_body)``. A stale keep-alive connection
+        (closed by the server between requests) is reconnected and retried
+        once; other transport errors surface as ``OllamaError``.
+        """
+
+        for retry_stale in (True, False):
+            connection = self._get_connection()
+            try:
+                connection.request(
+                    "POST", self._request_path(), body=body, headers=_REQUEST_HEADERS
+                )
+                response = connection.getresponse()
+                content = response.read().decode("utf-8")
+            except socket.timeout:
+                self._close_connection()
+                raise
+            except (http.client.HTTPException, OSError) as exc:
+                self._close_connection()
+                if retry_stale:
+                    continue
+                raise OllamaError(f"Could not reach Ollama: {exc}") from exc
+            if self.debug:
+                print(f"Ollama status: {response.status}", file=sys.stderr)
+            return response.status, content
+        raise OllamaError("Could not reach Ollama: connection could not be established")
+
     def generate(self, prompt: str, model: str, system: str | None = None) -> str:
-        payload = {
-            "model": model,
-            "prompt": prompt,
-            "stream": False,
-        }
+        # Only the prompt (and optional system) vary per call; the rest of
+        # the body comes from the cached per-model prefix.
+        encoded = _payload_prefix(model) + json.dumps(prompt).encode("utf-8")
         if system is not None:
-            payload["system"] = system
-        encoded = json.dumps(payload).encode("utf-8")
-        request = urllib.request.Request(
-            self._build_url(),
-            data=encoded,
-            headers={
-                "Content-Type": "application/json",
-            },
-            method="POST",
-        )
+            encoded += b',"system":' + json.dumps(system).encode("utf-8")
+        encoded += b"}"
 
         attempts = max(self.retries, 0) + 1
-        last_error: Exception | None = None
         for attempt in range(attempts):
             try:
-                with urllib.request.urlopen(request, timeout=self.timeout) as response:  # noqa: S310
-                    if self.debug:
-                        print(
-                            f"Ollama status: {getattr(response, 'status', 'unknown')}",
-                            file=sys.stderr,
-                        )
-                    content = response.read().decode("utf-8")
-                break
-            except socket.timeout as exc:  # pragma: no cover - network dependent
-                last_error = OllamaError(
+                status, content = self._do_request(encoded)
+            except socket.timeout as exc:
+                error = OllamaError(
                     "Ollama request timed out. Increase the timeout or check model performance."
                 )
                 if attempt < attempts - 1:
@@ -80,34 +180,220 @@ class OllamaClient:
                         )
                     time.sleep(wait_time)
                     continue
-                raise last_error from exc
-            except urllib.error.HTTPError as exc:  # pragma: no cover - network dependent
-                message = exc.read().decode("utf-8")
-                err = OllamaError(f"Ollama returned HTTP {exc.code}: {message}")
-                if attempt < attempts - 1 and exc.code >= 500:
-                    last_error = err
+                raise error from exc
+
+            if status >= 400:
+                error = OllamaError(f"Ollama returned HTTP {status}: {content}")
+                if attempt < attempts - 1 and status >= 500:
                     wait_time = 2 ** attempt  # Exponential backoff
                     if self.debug:
                         print(
-                            f"HTTP {exc.code} from Ollama (attempt {attempt + 1}/{attempts}), retrying in {wait_time}s...",
+                            f"HTTP {status} from Ollama (attempt {attempt + 1}/{attempts}), retrying in {wait_time}s...",
                             file=sys.stderr,
                         )
                     time.sleep(wait_time)
                     continue
-                raise err from exc
-            except urllib.error.URLError as exc:  # pragma: no cover - network dependent
-                err = OllamaError(f"Could not reach Ollama: {exc.reason}")
-                raise err from exc
+                raise error
+            break
+
+        return self.extract_message(_parse_payload(content))
+
+    def _get_session(self):
+        """Return the shared aiohttp session, creating it lazily.
+
+        One keep-alive connector serves every concurrent prompt, so the
+        async fan-out multiplexes over pooled connections instead of
+        handshaking per request.
+        """
+
+        loop = asyncio.get_running_loop()
+        session = self._aiohttp_session
+        if session is None or session.closed or self._aiohttp_loop is not loop:
+            # A session's connector is bound to the loop it was created on;
+            # reusing it from a later asyncio.run() fails with "Event loop
+            # is closed", so recreate whenever the running loop changes.
+            connector = aiohttp.TCPConnector(limit=64, keepalive_timeout=60)
+            session = aiohttp.ClientSession(connector=connector)
+            self._aiohttp_session = session
+            self._aiohttp_loop = loop
+        return session
+
+    async def aclose(self) -> None:
+        """Close the shared aiohttp session, if one was created."""
+
+        session = self._aiohttp_session
+        if session is not None and not session.closed:
+            await session.close()
+        self._aiohttp_session = None
+        self._aiohttp_loop = None
 
-        if last_error and attempts > 1 and "content" not in locals():
-            raise last_error
+    async def agenerate(self, prompt: str, model: str, system: str | None = None) -> str:
+        """Async counterpart of :meth:`generate`.
+
+        Uses aiohttp over a shared keep-alive connector when it is
+        installed; otherwise the blocking ``generate`` runs in the default
+        executor so callers still get a true awaitable either way.
+        """
+
+        if not AIOHTTP_AVAILABLE:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, partial(self.generate, prompt, model, system)
+            )
+
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            "stream": False,
+        }
+        if system is not None:
+            payload["system"] = system
+
+        session = self._get_session()
+        attempts = max(self.retries, 0) + 1
+        for attempt in range(attempts):
+            try:
+                async with session.post(
+                    self._build_url(),
+                    json=payload,
+                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                ) as response:
+                    status = response.status
+                    content = await response.text()
+            except asyncio.TimeoutError as exc:
+                error = OllamaError(
+                    "Ollama request timed out. Increase the timeout or check model performance."
+                )
+                if attempt < attempts - 1:
+                    # Non-blocking backoff: time.sleep here would stall every
+                    # other in-flight prompt on this event loop.
+                    await asyncio.sleep(2 ** attempt)
+                    continue
+                raise error from exc
+            except aiohttp.ClientError as exc:
+                raise OllamaError(f"Could not reach Ollama: {exc}") from exc
+
+            if status >= 400:
+                error = OllamaError(f"Ollama returned HTTP {status}: {content}")
+                if attempt < attempts - 1 and status >= 500:
+                    await asyncio.sleep(2 ** attempt)
+                    continue
+                raise error
+            break
+
+        return self.extract_message(_parse_payload(content))
+
+    async def abatch_generate(
+        self,
+        prompts: Sequence[str],
+        model: str,
+        *,
+        system: str | None = None,
+        concurrency: int = 8,
+    ) -> List[str]:
+        """Generate responses for many prompts with bounded concurrency.
+
+        Responses come back in prompt order; ``concurrency`` caps how many
+        requests are in flight at once (match it to the server's
+        ``OLLAMA_NUM_PARALLEL`` for best throughput).
+        """
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(prompt_text: str) -> str:
+            async with semaphore:
+                return await self.agenerate(prompt_text, model, system)
 
         try:
-            payload = json.loads(content)
-        except json.JSONDecodeError as exc:
-            raise OllamaError("Invalid JSON response from Ollama") from exc
+            return list(await asyncio.gather(*(_one(text) for text in prompts)))
+        finally:
+            # The session is loop-bound and this batch owns the loop's
+            # lifetime in the common asyncio.run() case, so tear it down
+            # here; the next batch recreates it lazily.
+            await self.aclose()
+
+    def iter_generate(self, prompt: str, model: str, system: str | None = None):
+        """Stream response text from Ollama chunk by chunk.
 
-        return self.extract_message(payload)
+        Uses the NDJSON streaming mode of ``/api/generate`` and yields the
+        incremental ``response`` text of each chunk. Abandoning the iterator
+        early closes the HTTP connection, which stops generation server-side
+        instead of paying for the full completion.
+        """
+
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            "stream": True,
+        }
+        if system is not None:
+            payload["system"] = system
+        request = urllib.request.Request(
+            self._build_url(),
+            data=json.dumps(payload).encode("utf-8"),
+            headers={
+                "Content-Type": "application/json",
+            },
+            method="POST",
+        )
+
+        try:
+            response = urllib.request.urlopen(request, timeout=self.timeout)  # noqa: S310
+        except socket.timeout as exc:  # pragma: no cover - network dependent
+            raise OllamaError(
+                "Ollama request timed out. Increase the timeout or check model performance."
+            ) from exc
+        except urllib.error.HTTPError as exc:  # pragma: no cover - network dependent
+            message = exc.read().decode("utf-8")
+            raise OllamaError(f"Ollama returned HTTP {exc.code}: {message}") from exc
+        except urllib.error.URLError as exc:  # pragma: no cover - network dependent
+            raise OllamaError(f"Could not reach Ollama: {exc.reason}") from exc
+
+        try:
+            for raw_line in response:
+                line = raw_line.strip()
+                if not line:
+                    continue
+                try:
+                    chunk = json.loads(line)
+                except json.JSONDecodeError as exc:
+                    raise OllamaError("Invalid JSON chunk in Ollama stream") from exc
+                text = chunk.get("response")
+                if text:
+                    yield text
+                if chunk.get("done"):
+                    break
+        finally:
+            response.close()
+
+    def generate_until(
+        self,
+        prompt: str,
+        model: str,
+        rules: Sequence,
+        system: str | None = None,
+    ) -> tuple[str, List[str]]:
+        """Stream a generation and stop as soon as any rule triggers.
+
+        After each streamed chunk the accumulated text is re-checked
+        against ``rules`` (anything with ``name`` and ``check(text)``); on
+        the first hit the stream is closed, which drops the HTTP connection
+        and stops generation server-side instead of paying for the rest of
+        the completion. Returns ``(text_so_far, triggered_rule_names)``.
+        """
+
+        pieces: List[str] = []
+        stream = self.iter_generate(prompt, model, system=system)
+        try:
+            for chunk in stream:
+                pieces.append(chunk)
+                text = "".join(pieces)
+                triggered = [rule.name for rule in rules if rule.check(text)]
+                if triggered:
+                    return text, triggered
+        finally:
+            stream.close()
+        return "".join(pieces), []
 
     @staticmethod
     def extract_message(payload: dict) -> str:
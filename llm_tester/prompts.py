@@ -7,12 +7,17 @@ subsequent prompts until another metadata block overrides it.
 """
 from __future__ import annotations
 
+import mmap
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Sequence
+from typing import Dict, Iterable, Iterator, List, Sequence
 
+# Above this size the file is memory-mapped so the OS pages in only what
+# is read - with max_prompts the tail of a big library is never touched.
+_MMAP_THRESHOLD = 64 * 1024
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Prompt:
     """Represents a single test scenario."""
 
@@ -31,6 +36,15 @@ def _parse_metadata(comment_line: str) -> dict[str, str]:
     return {key.strip().lower(): value.strip()}
 
 
+def _iter_mmap_lines(file_path: Path) -> Iterator[str]:
+    """Yield decoded lines from a memory-mapped file."""
+
+    with open(file_path, "rb") as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for raw_line in iter(mapped.readline, b""):
+                yield raw_line.decode("utf-8")
+
+
 def load_prompts(path: str | Path, max_prompts: int | None = None) -> List[Prompt]:
     """Load prompts from a line-delimited file with optional metadata comments."""
 
@@ -38,30 +52,42 @@ def load_prompts(path: str | Path, max_prompts: int | None = None) -> List[Promp
     if not file_path.exists():
         raise FileNotFoundError(f"Prompt file not found: {file_path}")
 
+    if file_path.stat().st_size > _MMAP_THRESHOLD:
+        lines = _iter_mmap_lines(file_path)
+        try:
+            return _parse_prompt_lines(lines, max_prompts)
+        finally:
+            lines.close()
+
+    # Read and split in one shot: splitlines() runs in C and avoids the
+    # per-line Python iteration of the file object for typical prompt files.
+    return _parse_prompt_lines(file_path.read_text(encoding="utf-8").splitlines(), max_prompts)
+
+
+def _parse_prompt_lines(lines: Iterable[str], max_prompts: int | None) -> List[Prompt]:
     prompts: List[Prompt] = []
     current_metadata: dict[str, str] = {}
 
-    with file_path.open("r", encoding="utf-8") as handle:
-        for raw_line in handle:
-            line = raw_line.strip()
-            if not line:
-                continue
-            if line.startswith("#"):
-                metadata_update = _parse_metadata(line)
-                if metadata_update:
-                    current_metadata.update(metadata_update)
-                continue
-
-            metadata = dict(current_metadata)
-            prompt = Prompt(
-                text=line,
-                category=metadata.get("category"),
-                metadata=metadata,
-            )
-            prompts.append(prompt)
-
-            if max_prompts is not None and len(prompts) >= max_prompts:
-                break
+    for raw_line in lines:
+        line = raw_line.strip()
+        if not line:
+            continue
+        if line.startswith("#"):
+            metadata_update = _parse_metadata(line)
+            if metadata_update:
+                current_metadata.update(metadata_update)
+            continue
+
+        metadata = dict(current_metadata)
+        prompt = Prompt(
+            text=line,
+            category=metadata.get("category"),
+            metadata=metadata,
+        )
+        prompts.append(prompt)
+
+        if max_prompts is not None and len(prompts) >= max_prompts:
+            break
 
     return prompts
 
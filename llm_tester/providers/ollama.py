@@ -56,6 +56,19 @@ class OllamaProvider(LLMProvider):
         except OllamaError as exc:
             raise ProviderError(str(exc)) from exc
 
+    async def agenerate(self, prompt: str, model: str, system: str | None = None) -> str:
+        """Async generate; the async engine awaits this when present."""
+        client = self._get_client()
+        try:
+            return await client.agenerate(prompt, model, system=system)
+        except OllamaError as exc:
+            raise ProviderError(str(exc)) from exc
+
+    async def aclose(self) -> None:
+        """Release async client resources; the async engine calls this after a sweep."""
+        if self._client is not None:
+            await self._client.aclose()
+
     def estimate_cost(self, prompt: str, response: str, model: str) -> float:
         """Ollama is free (local inference)."""
         return 0.0
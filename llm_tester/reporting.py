@@ -2,12 +2,26 @@
 from __future__ import annotations
 
 import html
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Sequence
 
 from llm_tester.runner import ResultRecord
 
+try:
+    import orjson  # type: ignore
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Row rendering is fanned out across processes only for very large runs;
+# below this the pool startup cost outweighs the rendering work.
+_PARALLEL_RENDER_THRESHOLD = 10_000
+
 
 def generate_statistics(records: Iterable[ResultRecord]) -> Dict[str, any]:
     """Generate statistical summary of assessment results.
@@ -18,38 +32,41 @@ def generate_statistics(records: Iterable[ResultRecord]) -> Dict[str, any]:
     Returns:
         Dictionary containing statistics
     """
-    records_list = list(records)
-    if not records_list:
+    # One traversal with running aggregates; separate comprehensions per
+    # statistic would walk the record list several times over.
+    total_prompts = 0
+    triggered_count = 0
+    total_length = 0
+    min_length: int | None = None
+    max_length = 0
+    categories: Counter[str] = Counter()
+    rule_triggers: Counter[str] = Counter()
+
+    for record in records:
+        total_prompts += 1
+        if record.triggered_rules:
+            triggered_count += 1
+            rule_triggers.update(record.triggered_rules)
+        categories[record.prompt_category or "uncategorized"] += 1
+        length = record.response_length
+        total_length += length
+        if min_length is None or length < min_length:
+            min_length = length
+        if length > max_length:
+            max_length = length
+
+    if not total_prompts:
         return {}
 
-    total_prompts = len(records_list)
-    triggered_count = sum(1 for r in records_list if r.triggered_rules)
-
-    # Count by category
-    categories: Dict[str, int] = {}
-    for record in records_list:
-        cat = record.prompt_category or "uncategorized"
-        categories[cat] = categories.get(cat, 0) + 1
-
-    # Count triggered rules
-    rule_triggers: Dict[str, int] = {}
-    for record in records_list:
-        for rule_name in record.triggered_rules:
-            rule_triggers[rule_name] = rule_triggers.get(rule_name, 0) + 1
-
-    # Response length stats
-    lengths = [r.response_length for r in records_list]
-    avg_length = sum(lengths) / len(lengths) if lengths else 0
-
     return {
         "total_prompts": total_prompts,
         "triggered_count": triggered_count,
-        "trigger_rate": (triggered_count / total_prompts * 100) if total_prompts else 0,
-        "categories": categories,
-        "rule_triggers": rule_triggers,
-        "avg_response_length": avg_length,
-        "min_response_length": min(lengths) if lengths else 0,
-        "max_response_length": max(lengths) if lengths else 0,
+        "trigger_rate": triggered_count / total_prompts * 100,
+        "categories": dict(categories),
+        "rule_triggers": dict(rule_triggers),
+        "avg_response_length": total_length / total_prompts,
+        "min_response_length": min_length,
+        "max_response_length": max_length,
     }
 
 
@@ -68,7 +85,19 @@ def generate_html_report(
     records_list = list(records)
     stats = generate_statistics(records_list)
 
-    html_content = f"""<!DOCTYPE html>
+    # Stream header, rows, and footer straight to disk: building the whole
+    # document in memory first would peak at many MB of transient strings
+    # on large sweeps, while this caps usage at one rendered chunk.
+    with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as handle:
+        handle.write(_report_header(title, stats))
+        _write_rows(handle, records_list)
+        handle.write(_REPORT_FOOTER)
+
+
+def _report_header(title: str, stats: Dict[str, any]) -> str:
+    """Render everything up to the open results ``<tbody>``."""
+
+    return f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -256,31 +285,8 @@ def generate_html_report(
             <tbody>
 """
 
-    # Add rows for each result
-    for record in records_list:
-        row_class = "triggered" if record.triggered_rules else ""
-        prompt_preview = html.escape(record.prompt[:100] + "..." if len(record.prompt) > 100 else record.prompt)
-        response_preview = html.escape(
-            record.response[:150] + "..." if len(record.response) > 150 else record.response
-        )
-        category = html.escape(record.prompt_category or "N/A")
-        timestamp = record.timestamp.split("T")[1][:8] if "T" in record.timestamp else record.timestamp[:8]
-
-        rules_html = "".join(
-            f'<span class="rule-badge">{html.escape(rule)}</span>' for rule in record.triggered_rules
-        )
-
-        html_content += f"""
-                <tr class="{row_class}">
-                    <td>{timestamp}</td>
-                    <td><span class="category-badge">{category}</span></td>
-                    <td class="prompt-text" title="{html.escape(record.prompt)}">{prompt_preview}</td>
-                    <td class="response-preview" title="{html.escape(record.response)}">{response_preview}</td>
-                    <td>{rules_html or "—"}</td>
-                </tr>
-"""
 
-    html_content += """
+_REPORT_FOOTER = """
             </tbody>
         </table>
     </div>
@@ -292,7 +298,55 @@ def generate_html_report(
 </html>
 """
 
-    Path(output_path).write_text(html_content, encoding="utf-8")
+
+def _render_row(record: ResultRecord) -> str:
+    """Render a single result record as an HTML table row."""
+    row_class = "triggered" if record.triggered_rules else ""
+    prompt_preview = html.escape(record.prompt[:100] + "..." if len(record.prompt) > 100 else record.prompt)
+    response_preview = html.escape(
+        record.response[:150] + "..." if len(record.response) > 150 else record.response
+    )
+    category = html.escape(record.prompt_category or "N/A")
+    timestamp = record.timestamp.split("T")[1][:8] if "T" in record.timestamp else record.timestamp[:8]
+
+    rules_html = "".join(
+        f'<span class="rule-badge">{html.escape(rule)}</span>' for rule in record.triggered_rules
+    )
+
+    return f"""
+                <tr class="{row_class}">
+                    <td>{timestamp}</td>
+                    <td><span class="category-badge">{category}</span></td>
+                    <td class="prompt-text" title="{html.escape(record.prompt)}">{prompt_preview}</td>
+                    <td class="response-preview" title="{html.escape(record.response)}">{response_preview}</td>
+                    <td>{rules_html or "—"}</td>
+                </tr>
+"""
+
+
+def _render_row_chunk(records: Sequence[ResultRecord]) -> str:
+    """Render a chunk of records; module-level so it stays picklable."""
+    return "".join(_render_row(record) for record in records)
+
+
+def _write_rows(handle, records: Sequence[ResultRecord], max_workers: int | None = None) -> None:
+    """Write all result rows to ``handle``, fanning out for huge runs.
+
+    Small runs render row by row straight into the (buffered) file; huge
+    runs render chunks across processes and write each chunk as it comes
+    back, in order, so at most one chunk is held in memory at a time.
+    """
+
+    if len(records) <= _PARALLEL_RENDER_THRESHOLD:
+        for record in records:
+            handle.write(_render_row(record))
+        return
+
+    chunk_size = max(len(records) // (os.cpu_count() or 1), 1)
+    chunks = [records[i : i + chunk_size] for i in range(0, len(records), chunk_size)]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for rendered in executor.map(_render_row_chunk, chunks):
+            handle.write(rendered)
 
 
 def _generate_bar_chart(data: Dict[str, int]) -> str:
@@ -378,7 +432,10 @@ def generate_sarif_report(results: List[ResultRecord], output_path: Path) -> Non
         }]
     }
 
-    output_path.write_text(json.dumps(sarif_doc, indent=2), encoding="utf-8")
+    if ORJSON_AVAILABLE:
+        output_path.write_bytes(orjson.dumps(sarif_doc, option=orjson.OPT_INDENT_2))
+    else:
+        output_path.write_text(json.dumps(sarif_doc, indent=2), encoding="utf-8")
 
 
 __all__ = ["generate_html_report", "generate_statistics", "generate_sarif_report"]
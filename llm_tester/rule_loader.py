@@ -2,11 +2,20 @@
 from __future__ import annotations
 
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 from llm_tester.rules import KeywordRule, RegexRule, Rule
 
+try:
+    import orjson  # type: ignore
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 def load_rules_from_json(file_path: str | Path) -> List[Rule]:
     """Load custom rules from a JSON file.
@@ -44,9 +53,23 @@ def load_rules_from_json(file_path: str | Path) -> List[Rule]:
     if not path.exists():
         raise FileNotFoundError(f"Rules file not found: {file_path}")
 
+    # Keying the cache on (path, mtime) makes invalidation automatic when
+    # the file changes; repeat loads of an unchanged file skip the parse
+    # and regex recompilation entirely.
+    return list(_load_rules_cached(str(path), os.stat(path).st_mtime))
+
+
+@lru_cache(maxsize=32)
+def _load_rules_cached(path_str: str, mtime: float) -> Tuple[Rule, ...]:
+    path = Path(path_str)
     try:
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        if ORJSON_AVAILABLE:
+            # orjson parses straight from bytes in C; its JSONDecodeError
+            # subclasses the stdlib one, so the handler below covers both.
+            data = orjson.loads(path.read_bytes())
+        else:
+            with path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
     except json.JSONDecodeError as exc:
         raise ValueError(f"Invalid JSON in rules file: {exc}") from exc
 
@@ -80,7 +103,9 @@ def load_rules_from_json(file_path: str | Path) -> List[Rule]:
     if not rules:
         raise ValueError("No rules found in JSON file")
 
-    return rules
+    # Rules are frozen dataclasses, so cached instances are safe to share;
+    # the public wrapper hands out a fresh list around them.
+    return tuple(rules)
 
 
 __all__ = ["load_rules_from_json"]
@@ -1,11 +1,12 @@
 """Core orchestration for running prompts against LLM providers or demo mode."""
 from __future__ import annotations
 
+import itertools
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import asdict, dataclass
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, fields
 from datetime import datetime, timezone
-from typing import Iterable, List, Sequence
+from typing import Iterable, List, Sequence, Tuple
 
 from llm_tester.analysis import analyze_response
 from llm_tester.client import OllamaClient, OllamaError
@@ -20,8 +21,15 @@ except ImportError:
 
 DEMO_ENV = "LLM_TESTER_DEMO"
 
+_UTC = timezone.utc
 
-@dataclass
+
+def _utc_now_iso() -> str:
+    """ISO-8601 UTC timestamp with the tzinfo bound once at import."""
+    return datetime.now(_UTC).isoformat()
+
+
+@dataclass(frozen=True, slots=True)
 class ResultRecord:
     timestamp: str
     prompt: str
@@ -29,7 +37,7 @@ class ResultRecord:
     response: str
     model: str
     response_length: int
-    triggered_rules: List[str]
+    triggered_rules: Tuple[str, ...]
     cost_usd: float = 0.0
     provider: str | None = None
 
@@ -82,18 +90,36 @@ def run_prompt(
         prompt_rules=prompt_rules,
     )
     return ResultRecord(
-        timestamp=datetime.now(timezone.utc).isoformat(),
+        timestamp=_utc_now_iso(),
         prompt=prompt.text,
         prompt_category=prompt.category,
         response=response,
         model=model,
         response_length=analysis.response_length,
-        triggered_rules=analysis.triggered_rules,
+        triggered_rules=tuple(analysis.triggered_rules),
         cost_usd=cost,
         provider=provider_name,
     )
 
 
+def _bin_prompts(
+    prompts: Sequence[Prompt], bins: int
+) -> List[List[tuple[int, Prompt]]]:
+    """Partition prompts into bins of similar text length.
+
+    Prompt length is a cheap proxy for generation cost; dispatching
+    similar-length prompts together keeps the set of in-flight requests
+    from being dominated by one slow outlier. Each entry keeps its original
+    index so callers can restore input order.
+    """
+
+    indexed = sorted(enumerate(prompts), key=lambda pair: len(pair[1].text))
+    if bins <= 1 or len(indexed) <= bins:
+        return [indexed]
+    size = -(-len(indexed) // bins)  # ceil division
+    return [indexed[start : start + size] for start in range(0, len(indexed), size)]
+
+
 def run_assessment(
     prompts: Sequence[Prompt],
     model: str,
@@ -105,6 +131,7 @@ def run_assessment(
     prompt_rules: Sequence[Rule] | None = None,
     system_prompt: str | None = None,
     workers: int = 1,
+    bins: int = 1,
     show_progress: bool = True,
 ) -> List[ResultRecord]:
     """Run assessment against multiple prompts.
@@ -119,6 +146,7 @@ def run_assessment(
         prompt_rules: Rules for prompt analysis
         system_prompt: Optional system prompt
         workers: Number of parallel workers (1 = sequential)
+        bins: Number of length-homogeneous dispatch bins (1 = input order)
         show_progress: Whether to show progress bar
 
     Returns:
@@ -131,38 +159,62 @@ def run_assessment(
     use_progress = show_progress and tqdm is not None
 
     if workers > 1:
-        # Parallel processing
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            future_to_prompt = {
-                executor.submit(
-                    run_prompt,
-                    prompt,
-                    model,
-                    client=client,
-                    demo_mode=effective_demo,
-                    analyze_prompt=analyze_prompt,
-                    rules=rules,
-                    prompt_rules=prompt_rules,
-                    system_prompt=system_prompt,
-                ): prompt
-                for prompt in prompts
-            }
-
-            # Use tqdm if available
-            futures = (
-                tqdm(as_completed(future_to_prompt), total=len(prompts), desc="Processing prompts")
-                if use_progress
-                else as_completed(future_to_prompt)
-            )
-
-            for future in futures:
-                try:
-                    record = future.result()
-                    results.append(record)
-                except Exception as exc:  # pragma: no cover
-                    # In parallel mode, we collect errors but continue
-                    prompt = future_to_prompt[future]
-                    raise OllamaError(f"Failed to process prompt: {prompt.text[:50]}...") from exc
+        # Parallel processing; results keep the input prompt order even
+        # though futures complete in arbitrary order. Submission uses a
+        # sliding window of at most 2 * workers outstanding futures, so a
+        # very large prompt list does not pre-build one future (and queued
+        # work item) per prompt up front.
+        ordered: List[ResultRecord | None] = [None] * len(prompts)
+        if bins > 1:
+            # Dispatch bin by bin so concurrently in-flight prompts have
+            # similar lengths; results still land at their original index.
+            pending_prompts = itertools.chain.from_iterable(_bin_prompts(prompts, bins))
+        else:
+            pending_prompts = enumerate(prompts)
+        window = 2 * workers
+        progress = tqdm(total=len(prompts), desc="Processing prompts") if use_progress else None
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+
+                def _submit(index: int, prompt: Prompt) -> None:
+                    future = executor.submit(
+                        run_prompt,
+                        prompt,
+                        model,
+                        client=client,
+                        demo_mode=effective_demo,
+                        analyze_prompt=analyze_prompt,
+                        rules=rules,
+                        prompt_rules=prompt_rules,
+                        system_prompt=system_prompt,
+                    )
+                    future_to_index[future] = index
+
+                future_to_index: dict = {}
+                for index, prompt in itertools.islice(pending_prompts, window):
+                    _submit(index, prompt)
+
+                while future_to_index:
+                    done, _ = wait(future_to_index, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        index = future_to_index.pop(future)
+                        try:
+                            ordered[index] = future.result()
+                        except Exception as exc:  # pragma: no cover
+                            prompt = prompts[index]
+                            raise OllamaError(
+                                f"Failed to process prompt: {prompt.text[:50]}..."
+                            ) from exc
+                        if progress is not None:
+                            progress.update(1)
+                        # Refill the window with the next unsubmitted prompt.
+                        for next_index, next_prompt in itertools.islice(pending_prompts, 1):
+                            _submit(next_index, next_prompt)
+        finally:
+            if progress is not None:
+                progress.close()
+
+        results.extend(record for record in ordered if record is not None)
     else:
         # Sequential processing
         prompt_iter = tqdm(prompts, desc="Processing prompts") if use_progress else prompts
@@ -183,8 +235,19 @@ def run_assessment(
     return results
 
 
+_RECORD_FIELDS = tuple(field.name for field in fields(ResultRecord))
+
+
 def serialize_results(records: Iterable[ResultRecord]) -> List[dict]:
-    return [asdict(record) for record in records]
+    # ResultRecord is flat, so plain attribute reads beat the recursive
+    # deep copy that dataclasses.asdict performs. triggered_rules goes back
+    # to a list so CSV/JSONL output keeps its historical shape.
+    rows: List[dict] = []
+    for record in records:
+        row = {name: getattr(record, name) for name in _RECORD_FIELDS}
+        row["triggered_rules"] = list(row["triggered_rules"])
+        rows.append(row)
+    return rows
 
 
 __all__ = ["ResultRecord", "run_assessment", "run_prompt", "serialize_results", "DEMO_ENV"]
@@ -22,6 +22,14 @@ setup(
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
         ],
+        # Optional accelerators; every import is guarded, so any subset works.
+        "fast": [
+            "aiohttp>=3.8.0",
+            "google-re2>=1.0",
+            "msgspec>=0.18.0",
+            "orjson>=3.8.0",
+            "pyahocorasick>=2.0.0",
+        ],
     },
     entry_points={
         "console_scripts": [
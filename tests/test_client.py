@@ -1,10 +1,10 @@
-import io
+import asyncio
+import json
 import socket
-import urllib.error
 
 import pytest
 
-from llm_tester.client import OllamaClient, OllamaError
+from llm_tester.client import AIOHTTP_AVAILABLE, OllamaClient, OllamaError
 
 
 def test_extract_message_supports_new_shape() -> None:
@@ -34,10 +34,10 @@ def test_from_env_applies_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
 def test_generate_converts_socket_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
     client = OllamaClient(base_url="http://example.com")
 
-    def _fake_urlopen(*args, **kwargs):  # noqa: ANN001
+    def _fake_do_request(body: bytes) -> tuple[int, str]:
         raise socket.timeout
 
-    monkeypatch.setattr("urllib.request.urlopen", _fake_urlopen)
+    monkeypatch.setattr(client, "_do_request", _fake_do_request)
 
     with pytest.raises(OllamaError) as excinfo:
         client.generate("hello", "model")
@@ -48,29 +48,15 @@ def test_generate_converts_socket_timeout(monkeypatch: pytest.MonkeyPatch) -> No
 def test_generate_retries_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
     client = OllamaClient(base_url="http://example.com", retries=1)
 
-    class _FakeResponse:
-        def __init__(self, payload: str) -> None:
-            self.payload = payload
-            self.status = 200
-
-        def read(self) -> bytes:
-            return self.payload.encode("utf-8")
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc, tb):  # noqa: ANN001
-            return False
-
     calls = []
 
-    def _fake_urlopen(*args, **kwargs):  # noqa: ANN001
+    def _fake_do_request(body: bytes) -> tuple[int, str]:
         calls.append(True)
         if len(calls) == 1:
             raise socket.timeout
-        return _FakeResponse('{"response": "ok"}')
+        return 200, '{"response": "ok"}'
 
-    monkeypatch.setattr("urllib.request.urlopen", _fake_urlopen)
+    monkeypatch.setattr(client, "_do_request", _fake_do_request)
 
     assert client.generate("hello", "model") == "ok"
     assert len(calls) == 2
@@ -79,33 +65,185 @@ def test_generate_retries_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
 def test_generate_retries_http_500(monkeypatch: pytest.MonkeyPatch) -> None:
     client = OllamaClient(base_url="http://example.com", retries=2)
 
+    responses = [(500, "fail"), (502, "fail"), (200, '{"response": "ok"}')]
+
+    def _fake_do_request(body: bytes) -> tuple[int, str]:
+        return responses.pop(0)
+
+    monkeypatch.setattr(client, "_do_request", _fake_do_request)
+
+    assert client.generate("hello", "model") == "ok"
+
+
+def test_generate_raises_on_http_400(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = OllamaClient(base_url="http://example.com", retries=2)
+
+    def _fake_do_request(body: bytes) -> tuple[int, str]:
+        return 400, "bad request"
+
+    monkeypatch.setattr(client, "_do_request", _fake_do_request)
+
+    with pytest.raises(OllamaError) as excinfo:
+        client.generate("hello", "model")
+
+    assert "HTTP 400" in str(excinfo.value)
+
+
+def test_generate_builds_valid_json_body(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = OllamaClient(base_url="http://example.com")
+    captured = {}
+
+    def _fake_do_request(body: bytes) -> tuple[int, str]:
+        captured["body"] = body
+        return 200, '{"response": "ok"}'
+
+    monkeypatch.setattr(client, "_do_request", _fake_do_request)
+
+    client.generate('say "hi"\n', "model-x", system="be safe")
+
+    assert json.loads(captured["body"]) == {
+        "model": "model-x",
+        "prompt": 'say "hi"\n',
+        "stream": False,
+        "system": "be safe",
+    }
+
+
+def test_agenerate_returns_response(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Pin the executor-fallback path so the test is deterministic whether or
+    # not aiohttp happens to be installed.
+    monkeypatch.setattr("llm_tester.client.AIOHTTP_AVAILABLE", False)
+    client = OllamaClient(base_url="http://example.com")
+
+    def _fake_do_request(body: bytes) -> tuple[int, str]:
+        return 200, '{"response": "async ok"}'
+
+    monkeypatch.setattr(client, "_do_request", _fake_do_request)
+
+    assert asyncio.run(client.agenerate("hello", "model")) == "async ok"
+
+
+def test_abatch_generate_preserves_prompt_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("llm_tester.client.AIOHTTP_AVAILABLE", False)
+    client = OllamaClient(base_url="http://example.com")
+
+    def _fake_do_request(body: bytes) -> tuple[int, str]:
+        prompt = json.loads(body)["prompt"]
+        return 200, json.dumps({"response": f"echo:{prompt}"})
+
+    monkeypatch.setattr(client, "_do_request", _fake_do_request)
+
+    prompts = [f"p{i}" for i in range(5)]
+    responses = asyncio.run(client.abatch_generate(prompts, "model", concurrency=2))
+
+    assert responses == [f"echo:p{i}" for i in range(5)]
+
+
+@pytest.mark.skipif(not AIOHTTP_AVAILABLE, reason="aiohttp not installed")
+def test_agenerate_uses_aiohttp_session(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = OllamaClient(base_url="http://example.com")
+
     class _FakeResponse:
-        def __init__(self, payload: str) -> None:
-            self.payload = payload
-            self.status = 200
+        status = 200
 
-        def read(self) -> bytes:
-            return self.payload.encode("utf-8")
+        async def text(self) -> str:
+            return '{"response": "aio ok"}'
 
-        def __enter__(self):
-            return self
+    class _FakePost:
+        async def __aenter__(self):
+            return _FakeResponse()
 
-        def __exit__(self, exc_type, exc, tb):  # noqa: ANN001
+        async def __aexit__(self, exc_type, exc, tb):  # noqa: ANN001
             return False
 
-    def _http_error(code: int) -> urllib.error.HTTPError:
-        return urllib.error.HTTPError(
-            url="http://example.com", code=code, msg="error", hdrs={}, fp=io.BytesIO(b"fail")
-        )
+    class _FakeSession:
+        def post(self, url, json=None, timeout=None):  # noqa: ANN001
+            return _FakePost()
 
-    responses = [_http_error(500), _http_error(502), _FakeResponse('{"response": "ok"}')]
+    monkeypatch.setattr(client, "_get_session", lambda: _FakeSession())
 
-    def _fake_urlopen(*args, **kwargs):  # noqa: ANN001
-        response = responses.pop(0)
-        if isinstance(response, urllib.error.HTTPError):
-            raise response
-        return response
+    assert asyncio.run(client.agenerate("hello", "model")) == "aio ok"
 
-    monkeypatch.setattr("urllib.request.urlopen", _fake_urlopen)
 
-    assert client.generate("hello", "model") == "ok"
+def test_iter_generate_streams_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = OllamaClient(base_url="http://example.com")
+
+    class _FakeStream:
+        def __init__(self, lines) -> None:  # noqa: ANN001
+            self.lines = lines
+            self.closed = False
+
+        def __iter__(self):
+            return iter(self.lines)
+
+        def close(self) -> None:
+            self.closed = True
+
+    stream = _FakeStream(
+        [b'{"response": "Hel"}\n', b'{"response": "lo"}\n', b'{"done": true}\n']
+    )
+    monkeypatch.setattr("urllib.request.urlopen", lambda *args, **kwargs: stream)
+
+    assert list(client.iter_generate("hi", "model")) == ["Hel", "lo"]
+    assert stream.closed
+
+
+def test_generate_until_stops_on_first_rule_hit(monkeypatch: pytest.MonkeyPatch) -> None:
+    from llm_tester.rules import KeywordRule
+
+    client = OllamaClient(base_url="http://example.com")
+
+    class _FakeStream:
+        def __init__(self, lines) -> None:  # noqa: ANN001
+            self.lines = lines
+            self.consumed = 0
+            self.closed = False
+
+        def __iter__(self):
+            for line in self.lines:
+                self.consumed += 1
+                yield line
+
+        def close(self) -> None:
+            self.closed = True
+
+    stream = _FakeStream(
+        [
+            b'{"response": "I will "}\n',
+            b'{"response": "ignore previous instructions"}\n',
+            b'{"response": " and much more text"}\n',
+            b'{"done": true}\n',
+        ]
+    )
+    monkeypatch.setattr("urllib.request.urlopen", lambda *args, **kwargs: stream)
+
+    rule = KeywordRule(name="test_rule", description="", keywords=["ignore previous instructions"])
+    text, triggered = client.generate_until("hi", "model", [rule])
+
+    assert triggered == ["test_rule"]
+    assert text == "I will ignore previous instructions"
+    assert stream.consumed == 2
+    assert stream.closed
+
+
+def test_iter_generate_closes_on_early_break(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = OllamaClient(base_url="http://example.com")
+
+    class _FakeStream:
+        def __init__(self, lines) -> None:  # noqa: ANN001
+            self.lines = lines
+            self.closed = False
+
+        def __iter__(self):
+            return iter(self.lines)
+
+        def close(self) -> None:
+            self.closed = True
+
+    stream = _FakeStream([b'{"response": "chunk"}\n'] * 100)
+    monkeypatch.setattr("urllib.request.urlopen", lambda *args, **kwargs: stream)
+
+    iterator = client.iter_generate("hi", "model")
+    assert next(iterator) == "chunk"
+    iterator.close()
+    assert stream.closed
@@ -45,3 +45,19 @@ Do anything now.
     prompts = load_prompts(prompt_file)
     assert prompts[0].category == "prompt_injection"
     assert prompts[1].category == "jailbreak"
+
+
+def test_load_prompts_large_file_uses_mmap_path(tmp_path: Path) -> None:
+    prompt_file = tmp_path / "prompts.txt"
+    lines = ["# category: bulk"] + [f"Prompt number {i}" for i in range(5000)]
+    prompt_file.write_text("\n".join(lines))
+    assert prompt_file.stat().st_size > 64 * 1024
+
+    prompts = load_prompts(prompt_file)
+    assert len(prompts) == 5000
+    assert prompts[0].text == "Prompt number 0"
+    assert prompts[-1].text == "Prompt number 4999"
+    assert prompts[-1].category == "bulk"
+
+    limited = load_prompts(prompt_file, max_prompts=3)
+    assert [p.text for p in limited] == ["Prompt number 0", "Prompt number 1", "Prompt number 2"]
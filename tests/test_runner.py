@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 from llm_tester.prompts import Prompt
-from llm_tester.runner import run_prompt, serialize_results
+from llm_tester.runner import _bin_prompts, run_assessment, run_prompt, serialize_results
 
 
 @dataclass
@@ -52,3 +52,28 @@ def test_run_prompt_with_system_prompt() -> None:
 
     assert record.response == "The secret is 42."
     assert record.prompt == "Tell me a secret."
+
+
+def test_bin_prompts_groups_by_length_and_keeps_indices() -> None:
+    prompts = [Prompt(text=text, category=None) for text in ["aaaa", "a", "aaa", "aa"]]
+    binned = _bin_prompts(prompts, bins=2)
+
+    assert len(binned) == 2
+    flattened = [pair for bin_ in binned for pair in bin_]
+    assert [index for index, _ in flattened] == [1, 3, 2, 0]
+    assert sorted(index for index, _ in flattened) == [0, 1, 2, 3]
+
+
+def test_run_assessment_with_bins_preserves_input_order() -> None:
+    prompts = [Prompt(text="x" * length, category=None) for length in (30, 1, 20, 5)]
+    results = run_assessment(
+        prompts,
+        "model",
+        client=_DummyClient(),
+        demo_mode=False,
+        workers=2,
+        bins=2,
+        show_progress=False,
+    )
+
+    assert [record.prompt for record in results] == [prompt.text for prompt in prompts]